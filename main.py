@@ -2,7 +2,7 @@ import argparse
 import sys
 import os
 from dotenv import load_dotenv
-from src.utils.logger import log_experiment, ActionType  # Import ActionType
+from src.utils.logger import log_experiment, flush_to_json, ActionType  # Import ActionType
 
 load_dotenv()
 
@@ -28,6 +28,14 @@ def main():
         }
     )
 
+    # Regenerate logs/experiment_data.json now rather than only at exit, so
+    # a LOG_FILE that diverged from the journal fails the run
+    try:
+        flush_to_json()
+    except ValueError as e:
+        print(e)
+        sys.exit(1)
+
     print("✅ MISSION_COMPLETE")
 
 if __name__ == "__main__":
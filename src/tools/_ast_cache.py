@@ -0,0 +1,51 @@
+"""
+AST metrics cache for Toolsmith
+Keeps per-source metrics in memory so repeated checks of unchanged sources skip parsing
+"""
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+# Entries kept, least recently used dropped first
+MAX_ENTRIES = 1024
+
+# Bump when the cached metrics layout changes. The interpreter version is
+# part of it: whether a source parses depends on the Python grammar
+_VERSION = b"ast-v1-py%d.%d" % sys.version_info[:2]
+
+_cache: "OrderedDict[bytes, Dict]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def cache_key(content: str) -> bytes:
+    """
+    Hash source content into a cache key.
+    """
+    return hashlib.blake2b(
+        content.encode("utf-8", "surrogatepass"), digest_size=16, person=_VERSION
+    ).digest()
+
+
+def get(key: bytes) -> Optional[Dict]:
+    """
+    Return a copy of the cached metrics for a key, or None on miss.
+    """
+    with _lock:
+        metrics = _cache.get(key)
+        if metrics is None:
+            return None
+        _cache.move_to_end(key)
+    return dict(metrics)
+
+
+def put(key: bytes, metrics: Dict) -> None:
+    """
+    Store metrics for a key, dropping the least recently used beyond MAX_ENTRIES.
+    """
+    with _lock:
+        _cache[key] = dict(metrics)
+        _cache.move_to_end(key)
+        while len(_cache) > MAX_ENTRIES:
+            _cache.popitem(last=False)
@@ -0,0 +1,100 @@
+"""
+Subprocess helpers for Toolsmith
+Run tool commands with a mandatory timeout and kill the whole process tree on expiry
+"""
+import atexit
+import os
+import signal
+import subprocess
+import weakref
+from typing import List
+
+# Grace period between SIGTERM and SIGKILL
+_KILL_GRACE = 1.0
+
+_active: "weakref.WeakSet[subprocess.Popen]" = weakref.WeakSet()
+
+
+def new_session_kwargs() -> dict:
+    """
+    Popen kwargs that put the child in its own process group.
+    """
+    if os.name == "posix":
+        return {"start_new_session": True}
+    return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+
+
+def kill_tree(pid: int, grace: float = _KILL_GRACE, wait=None) -> None:
+    """
+    Terminate a child started with new_session_kwargs() and all its descendants.
+
+    On POSIX the process group gets SIGTERM, then SIGKILL after grace
+    seconds. wait(timeout) should block until the leader exits. On Windows
+    taskkill /T walks the tree.
+    """
+    if os.name != "posix":
+        subprocess.run(
+            ["taskkill", "/F", "/T", "/PID", str(pid)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        return
+
+    try:
+        os.killpg(pid, signal.SIGTERM)
+    except ProcessLookupError:
+        return
+
+    if wait is not None:
+        try:
+            wait(grace)
+        except subprocess.TimeoutExpired:
+            pass
+
+    # Descendants may ignore SIGTERM or outlive the leader
+    try:
+        os.killpg(pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+def run_safe(cmd: List[str], timeout: float, **kwargs) -> subprocess.CompletedProcess:
+    """
+    subprocess.run(cmd, capture_output=True, text=True, timeout=timeout) that
+    kills the whole process tree, not just the direct child, on timeout.
+
+    Raises:
+        subprocess.TimeoutExpired: If the command exceeds timeout
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        **new_session_kwargs(),
+        **kwargs
+    )
+    _active.add(proc)
+    try:
+        stdout, stderr = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        kill_tree(proc.pid, wait=proc.wait)
+        stdout, stderr = proc.communicate()
+        raise subprocess.TimeoutExpired(cmd, timeout, output=stdout, stderr=stderr)
+    except BaseException:
+        kill_tree(proc.pid, grace=0, wait=proc.wait)
+        raise
+    finally:
+        _active.discard(proc)
+
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
+
+@atexit.register
+def _sweep() -> None:
+    """
+    Kill process trees still running when the interpreter exits.
+    """
+    for proc in list(_active):
+        if proc.poll() is None:
+            kill_tree(proc.pid, grace=0)
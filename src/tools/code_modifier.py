@@ -4,18 +4,71 @@ Apply code fixes and validate syntax
 """
 import ast
 import json
+from collections import deque
 from typing import Dict
 
-from src.utils.logger import log_experiment, ActionType
+from src.utils.logger import log_experiment_async, ActionType
 from src.tools.sandbox_manager import is_path_in_sandbox
-from src.tools.file_tools import read_file, write_file
+from src.tools.file_tools import read_file, write_file, read_bytes
+from src.tools import _ast_cache
+
+# Calling compile() directly skips ast.parse's Python-level wrapper
+_PARSE_FLAGS = ast.PyCF_ONLY_AST
+
+
+def _visit(tree: ast.AST) -> Dict:
+    """
+    Collect function/class/docstring/main-guard counts in a single pass.
+    """
+    out = {"functions": 0, "classes": 0, "missing_docstrings": 0, "has_main": False}
+    FunctionDef, ClassDef, If = ast.FunctionDef, ast.ClassDef, ast.If
+    iter_children = ast.iter_child_nodes
+    todo = deque([tree])
+    while todo:
+        node = todo.popleft()
+        t = type(node)
+        if t is FunctionDef or t is ClassDef:
+            out["functions" if t is FunctionDef else "classes"] += 1
+            body = node.body
+            first = body[0] if body else None
+            if not (
+                type(first) is ast.Expr
+                and type(first.value) is ast.Constant
+                and isinstance(first.value.value, str)
+                and first.value.value.strip()
+            ):
+                out["missing_docstrings"] += 1
+        elif t is If and not out["has_main"]:
+            test = node.test
+            if (
+                type(test) is ast.Compare
+                and type(test.left) is ast.Name
+                and test.left.id == "__name__"
+            ):
+                out["has_main"] = True
+        todo.extend(iter_children(node))
+    return out
+
+
+def _source_metrics(content: str, filename: str = '<string>') -> Dict:
+    """
+    Return _visit counts for source, parsing only on a cache miss.
+    """
+    key = _ast_cache.cache_key(content)
+    counts = _ast_cache.get(key)
+    if counts is None:
+        tree = compile(content, filename, 'exec', _PARSE_FLAGS)
+        counts = _visit(tree)
+        _ast_cache.put(key, counts)
+    return counts
 
 
 def validate_python_syntax(code: str) -> None:
     """
     Validate Python code syntax.
     """
-    ast.parse(code)
+    # Parse only: validation never fills the metrics cache
+    compile(code, '<string>', 'exec', _PARSE_FLAGS)
 
 
 def apply_fix(file_path: str, fixed_code: str, sandbox_dir: str = "./sandbox") -> Dict:
@@ -26,6 +79,7 @@ def apply_fix(file_path: str, fixed_code: str, sandbox_dir: str = "./sandbox") -
 
     validate_python_syntax(fixed_code)
 
+    # Through file_tools, so the read and the write are both logged
     original_content = read_file(file_path, sandbox_dir)
     write_file(file_path, fixed_code, sandbox_dir)
 
@@ -36,7 +90,7 @@ def apply_fix(file_path: str, fixed_code: str, sandbox_dir: str = "./sandbox") -
         "size_change": len(fixed_code) - len(original_content)
     }
 
-    log_experiment(
+    log_experiment_async(
         agent_name="Toolsmith",
         model_used="code_modifier",
         action=ActionType.FIX,
@@ -54,23 +108,14 @@ def add_docstring(file_path: str, sandbox_dir: str = "./sandbox") -> Dict:
     """
     Analyze missing docstrings.
     """
-    is_path_in_sandbox(file_path, sandbox_dir)
-
     content = read_file(file_path, sandbox_dir)
-    tree = ast.parse(content)
-
-    missing = sum(
-        1 for node in ast.walk(tree)
-        if isinstance(node, (ast.FunctionDef, ast.ClassDef))
-        and not ast.get_docstring(node)
-    )
 
     result = {
         "file_path": file_path,
-        "missing_docstrings": missing
+        "missing_docstrings": _source_metrics(content, file_path)["missing_docstrings"]
     }
 
-    log_experiment(
+    log_experiment_async(
         agent_name="Toolsmith",
         model_used="code_modifier",
         action=ActionType.ANALYSIS,
@@ -88,28 +133,18 @@ def get_code_metrics(file_path: str, sandbox_dir: str = "./sandbox") -> Dict:
     """
     Compute basic code metrics.
     """
-    is_path_in_sandbox(file_path, sandbox_dir)
-
     content = read_file(file_path, sandbox_dir)
-    tree = ast.parse(content)
-
-    has_main = any(
-        isinstance(node, ast.If)
-        and isinstance(node.test, ast.Compare)
-        and isinstance(node.test.left, ast.Name)
-        and node.test.left.id == "__name__"
-        for node in ast.walk(tree)
-    )
+    counts = _source_metrics(content, file_path)
 
     metrics = {
         "file_path": file_path,
         "lines_of_code": len(content.split("\n")),
-        "functions": sum(isinstance(n, ast.FunctionDef) for n in ast.walk(tree)),
-        "classes": sum(isinstance(n, ast.ClassDef) for n in ast.walk(tree)),
-        "has_main": has_main
+        "functions": counts["functions"],
+        "classes": counts["classes"],
+        "has_main": counts["has_main"]
     }
 
-    log_experiment(
+    log_experiment_async(
         agent_name="Toolsmith",
         model_used="code_modifier",
         action=ActionType.ANALYSIS,
@@ -127,11 +162,8 @@ def compare_files(file_path1: str, file_path2: str, sandbox_dir: str = "./sandbo
     """
     Compare two Python files.
     """
-    is_path_in_sandbox(file_path1, sandbox_dir)
-    is_path_in_sandbox(file_path2, sandbox_dir)
-
-    content1 = read_file(file_path1, sandbox_dir)
-    content2 = read_file(file_path2, sandbox_dir)
+    content1 = read_bytes(file_path1, sandbox_dir)
+    content2 = read_bytes(file_path2, sandbox_dir)
 
     result = {
         "file1": file_path1,
@@ -139,7 +171,7 @@ def compare_files(file_path1: str, file_path2: str, sandbox_dir: str = "./sandbo
         "identical": content1 == content2
     }
 
-    log_experiment(
+    log_experiment_async(
         agent_name="Toolsmith",
         model_used="code_modifier",
         action=ActionType.ANALYSIS,
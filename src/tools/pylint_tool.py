@@ -2,14 +2,103 @@
 Pylint Tool for Toolsmith
 Static code analysis and quality scoring
 """
-import subprocess
-import json
+import ast
+import asyncio
+import copy
+import hashlib
+import importlib.metadata
+import importlib.util
+import io
+import multiprocessing
+import os
+import queue
 import re
-from typing import Dict
+import subprocess
+import sysconfig
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
-from src.utils.logger import log_experiment, ActionType
+from src.utils import _json
+from src.utils.logger import log_experiment_async, ActionType
 from src.tools.file_tools import list_files
 from src.tools.sandbox_manager import is_path_in_sandbox
+from src.tools._subprocess_safe import run_safe, new_session_kwargs, kill_tree
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# pylint is imported by the worker processes only; importing this module
+# does not load it
+_HAS_PYLINT = importlib.util.find_spec("pylint") is not None
+try:
+    _PYLINT_VERSION = importlib.metadata.version("pylint") if _HAS_PYLINT else "cli"
+except importlib.metadata.PackageNotFoundError:
+    _PYLINT_VERSION = "unknown"
+
+
+# Results cache: an in-memory LRU of (issues, score) in front of
+# _DISK_CACHE_DIR, both under the key from _cache_key. Nothing is read
+# until the first analysis.
+_PYLINT_CONFIG_FILES = (".pylintrc", "pylintrc", "pyproject.toml", "setup.cfg")
+_MEMORY_CACHE_MAX = 1000
+_pylint_cache: Dict[str, Tuple[List[Dict], float]] = {}
+_pylint_inflight: Dict[str, threading.Event] = {}
+_pylint_lock = threading.Lock()
+
+_SCORE_RE = re.compile(r"rated at ([-\d.]+)/10")
+
+# Keys of an issue, as in pylint's json report. json2 messages and the
+# in-process reporter are mapped onto this set so results have one shape
+_ISSUE_KEYS = (
+    "type", "module", "obj", "line", "column", "endLine", "endColumn",
+    "path", "symbol", "message", "message-id"
+)
+
+# Bumped whenever the cached result shape changes, to drop older entries
+_CACHE_FORMAT = "issues-v1"
+
+# One JSON file per cache key; results of unchanged files persist across
+# runs. At most _DISK_CACHE_MAX files, least recently used pruned first
+_DISK_CACHE_DIR = Path("./.pylint_cache")
+_DISK_CACHE_MAX = 1000
+
+# Module path -> ((mtime_ns, size, inode), (content digest, imported names)),
+# so the modules shared by many files are read and parsed once
+_module_memo: Dict[str, Tuple[tuple, Tuple[str, List[Tuple[int, str]]]]] = {}
+_MODULE_MEMO_MAX = 4096
+
+# Files per in-process pylint job in directory scans; bounded so one slow
+# chunk does not hold up a whole worker
+_BATCH_SIZE = 32
+
+# Seconds allowed per file, for the CLI and for in-process jobs alike
+_PYLINT_TIMEOUT = 30
+
+# astroid keeps modules under these directories (stdlib, installed
+# packages) between runs; any other module is re-read on each job
+_STABLE_PREFIXES = tuple(
+    os.path.join(os.path.realpath(path), "")
+    for path in {sysconfig.get_path(name) for name in ("stdlib", "platstdlib", "purelib", "platlib")}
+    if path
+)
+
+# Outcome of an in-process job that ran past its deadline
+_JOB_TIMEOUT = object()
+
+# Worker pool for in-process pylint, created by _get_pool on first use and
+# reused. Workers are started by forkserver (or spawn), never forked from
+# this process and its threads (e.g. the logger's writer and its locks)
+_POOL_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+_POOL_SIZE = os.cpu_count() or 1
+_POOL_POLL = 0.5
+_pool = None
+_pool_lock = threading.Lock()
 
 
 def run_pylint_analysis(file_path: str, sandbox_dir: str = "./sandbox") -> Dict:
@@ -18,53 +107,366 @@ def run_pylint_analysis(file_path: str, sandbox_dir: str = "./sandbox") -> Dict:
     """
     is_path_in_sandbox(file_path, sandbox_dir)
 
+    return _record_analysis(file_path, _cached_pylint_worker(file_path, sandbox_dir))
+
+
+def _config_stamp() -> list:
+    """
+    pylint version and mtime_ns of each pylint config file (0 if absent), so
+    upgrading pylint or editing its configuration invalidates every cached result.
+    """
+    stamp: list = [_PYLINT_VERSION, _CACHE_FORMAT]
+    for name in _PYLINT_CONFIG_FILES:
+        try:
+            stamp.append(os.stat(name).st_mtime_ns)
+        except OSError:
+            stamp.append(0)
+    return stamp
+
+
+def _cache_get(key: Optional[str]) -> Optional[Tuple[List[Dict], float]]:
+    """
+    Cached (issues, score) for a key, from memory or else from disk.
+
+    Returns a copy: callers may modify it without affecting later calls.
+    """
+    if key is None:
+        return None
+    with _pylint_lock:
+        entry = _pylint_cache.pop(key, None)
+        if entry is not None:
+            # Move to the end: eviction drops the least recently used first
+            _pylint_cache[key] = entry
+            return copy.deepcopy(entry)
+    entry = _disk_cache_get(key)
+    if entry is not None:
+        _memory_store(key, entry)
+    return entry
+
+
+def _cache_put(key: Optional[str], issues: List[Dict], score: float) -> None:
+    """
+    Remember a successful analysis in memory and on disk.
+    """
+    if key is None:
+        return
+    _memory_store(key, (issues, score))
+    _disk_cache_put(key, issues, score)
+
+
+def _memory_store(key: str, entry: Tuple[List[Dict], float]) -> None:
+    """
+    Insert a copy into the in-memory LRU, dropping entries beyond _MEMORY_CACHE_MAX.
+    """
+    entry = copy.deepcopy(entry)
+    with _pylint_lock:
+        _pylint_cache.pop(key, None)
+        _pylint_cache[key] = entry
+        while len(_pylint_cache) > _MEMORY_CACHE_MAX:
+            del _pylint_cache[next(iter(_pylint_cache))]
+
+
+def _cached_pylint_worker(file_path: str, sandbox_dir: str) -> Tuple[str, object]:
+    """
+    _pylint_worker with the results cache and single-flight coalescing.
+
+    Calls for an unchanged file reuse the cached outcome; concurrent callers
+    wait for the run already in flight. Failures are always retried.
+    """
+    key = _cache_key(file_path, sandbox_dir)
+    if key is None:
+        return _pylint_worker(file_path)
+
+    while True:
+        cached = _cache_get(key)
+        if cached is not None:
+            return "ok", cached
+        with _pylint_lock:
+            if key in _pylint_cache:
+                continue  # Stored since the lookup above
+            event = _pylint_inflight.get(key)
+            leader = event is None
+            if leader:
+                event = _pylint_inflight[key] = threading.Event()
+
+        if leader:
+            break
+        event.wait()
+
     try:
-        # Run pylint with JSON output
-        result_json = subprocess.run(
-            ["pylint", "--output-format=json", file_path],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        outcome = _pylint_worker(file_path)
+        if outcome[0] == "ok":
+            _cache_put(key, *outcome[1])
+    finally:
+        with _pylint_lock:
+            del _pylint_inflight[key]
+        event.set()
+    return outcome
+
+
+def _module_info(path: str) -> Optional[Tuple[str, List[Tuple[int, str]]]]:
+    """
+    (content digest, imported module names) of a module, memoized by
+    (mtime_ns, size, inode); None if it cannot be read.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    sig = (st.st_mtime_ns, st.st_size, st.st_ino)
+    memo = _module_memo.get(path)
+    if memo is not None and memo[0] == sig:
+        return memo[1]
+
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    h = xxhash.xxh3_128() if xxhash is not None else hashlib.blake2b(digest_size=16)
+    h.update(data)
+
+    names: List[Tuple[int, str]] = []
+    try:
+        tree = ast.parse(data)
+    except (SyntaxError, ValueError):
+        tree = None
+    for node in ast.walk(tree) if tree is not None else ():
+        if isinstance(node, ast.Import):
+            names.extend((0, alias.name) for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            names.append((node.level, base))
+            # "from pkg import name" may import the submodule pkg.name
+            names.extend(
+                (node.level, f"{base}.{alias.name}" if base else alias.name)
+                for alias in node.names if alias.name != "*"
+            )
+
+    info = (h.hexdigest(), names)
+    if len(_module_memo) >= _MODULE_MEMO_MAX:
+        _module_memo.clear()
+    _module_memo[path] = (sig, info)
+    return info
+
+
+def _resolve_module(level: int, name: str, path: str, roots: List[str]) -> List[str]:
+    """
+    Files an import of name from the module at path loads: the modules of
+    each package on the way and the module itself.
+    """
+    if level:
+        base = os.path.dirname(path)
+        for _ in range(level - 1):
+            base = os.path.dirname(base)
+        bases = [base]
+    else:
+        bases = roots
+
+    parts = name.split(".") if name else []
+    for base in bases:
+        found = []
+        current = base
+        for part in parts:
+            current = os.path.join(current, part)
+            init = os.path.join(current, "__init__.py")
+            if os.path.isfile(init):
+                found.append(init)
+        if not parts:
+            init = os.path.join(current, "__init__.py")
+            if os.path.isfile(init):
+                found.append(init)
+        for suffix in (".py", ".pyi"):
+            if parts and os.path.isfile(current + suffix):
+                found.append(current + suffix)
+        if found:
+            return found
+    return []
+
+
+def _import_roots(path: str, sandbox_root: str) -> List[str]:
+    """
+    Directories absolute imports of a module resolve against, as pylint
+    sees them: the first directory above its package, then the sandbox.
+    """
+    base = os.path.dirname(path)
+    while os.path.isfile(os.path.join(base, "__init__.py")) and os.path.dirname(base) != base:
+        base = os.path.dirname(base)
+    return [base] if base == sandbox_root else [base, sandbox_root]
+
+
+def _dependency_digests(file_path: str, sandbox_dir: str) -> Optional[List[str]]:
+    """
+    "path\0digest" of file_path and of every sandbox module it imports,
+    directly or not, sorted; None if file_path cannot be read.
+
+    Messages such as import-error, no-member or no-name-in-module depend on
+    the modules a file imports, so they are part of the cache key.
+    """
+    sandbox_root = os.path.abspath(sandbox_dir)
+    prefix = os.path.join(sandbox_root, "")
+    first = os.path.abspath(file_path)
+    digests: Dict[str, str] = {}
+    stack = [first]
+    while stack:
+        path = stack.pop()
+        if path in digests:
+            continue
+        info = _module_info(path)
+        if info is None:
+            if path == first:
+                return None
+            continue
+        digests[path] = info[0]
+        roots = _import_roots(path, sandbox_root)
+        for level, name in info[1]:
+            for dep in _resolve_module(level, name, path, roots):
+                dep = os.path.abspath(dep)
+                if dep.startswith(prefix) and dep not in digests:
+                    stack.append(dep)
+    return sorted(f"{path}\0{digest}" for path, digest in digests.items())
+
+
+def _cache_key(file_path: str, sandbox_dir: str) -> Optional[str]:
+    """
+    Hash pylint version and config, absolute path, and the content of the
+    file and of the sandbox modules it imports into a cache key.
+
+    The path is part of the key because messages carry module/path info.
+    """
+    digests = _dependency_digests(file_path, sandbox_dir)
+    if digests is None:
+        return None
+
+    h = xxhash.xxh3_128() if xxhash is not None else hashlib.blake2b(digest_size=16)
+    for part in (*map(str, _config_stamp()), os.path.abspath(file_path), *digests):
+        h.update(os.fsencode(part))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _disk_cache_get(key: Optional[str]) -> Optional[Tuple[List[Dict], float]]:
+    """
+    Load (issues, score) for a key; malformed entries are discarded.
+    """
+    if key is None:
+        return None
 
+    path = _DISK_CACHE_DIR / f"{key}.json"
+    try:
+        with open(path, 'rb') as f:
+            entry = _json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+    # Only trust entries with the exact shape we write
+    if not (
+        isinstance(entry, dict)
+        and isinstance(entry.get("issues"), list)
+        and isinstance(entry.get("score"), (int, float))
+    ):
         try:
-            issues = json.loads(result_json.stdout)
-        except json.JSONDecodeError:
-            issues = []
-
-        # Run pylint again to extract score
-        result_text = subprocess.run(
-            ["pylint", file_path],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+            path.unlink()
+        except OSError:
+            pass
+        return None
 
-        score = extract_pylint_score(result_text.stdout + result_text.stderr)
+    try:
+        os.utime(path)  # Mark as recently used for pruning
+    except OSError:
+        pass
+    return entry["issues"], float(entry["score"])
 
-        errors = [i for i in issues if i.get("type") == "error"]
-        warnings = [i for i in issues if i.get("type") == "warning"]
 
-        analysis_result = {
-            "file": file_path,
-            "score": score,
-            "total_issues": len(issues),
-            "errors": len(errors),
-            "warnings": len(warnings),
-            "issues": issues[:20],
-            "issues_detail": [
-                {
-                    "line": i.get("line"),
-                    "column": i.get("column"),
-                    "type": i.get("type"),
-                    "symbol": i.get("symbol"),
-                    "message": i.get("message")
-                }
-                for i in issues[:10]
-            ]
-        }
+def _disk_cache_put(key: Optional[str], issues: List[Dict], score: float) -> None:
+    """
+    Atomically store (issues, score) and prune the oldest entries.
+    """
+    if key is None:
+        return
+
+    try:
+        _DISK_CACHE_DIR.mkdir(exist_ok=True)
+        tmp = _DISK_CACHE_DIR / f"{key}.{os.getpid()}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(_json.dumps({"issues": issues, "score": score}))
+        os.replace(tmp, _DISK_CACHE_DIR / f"{key}.json")
+
+        entries = [e for e in os.scandir(_DISK_CACHE_DIR) if e.name.endswith(".json")]
+        if len(entries) > _DISK_CACHE_MAX:
+            entries.sort(key=lambda e: e.stat().st_mtime_ns)
+            for entry in entries[:len(entries) - _DISK_CACHE_MAX]:
+                os.unlink(entry.path)
+    except OSError:
+        pass  # The cache is an optimization; never fail the analysis
 
-        log_experiment(
+
+def _build_result(file_path: str, issues: List[Dict], score: float) -> Dict:
+    """
+    Shape pylint messages and score into the analysis result dict.
+    """
+    errors, warnings, issues_detail = _categorize(issues)
+
+    return {
+        "file": file_path,
+        "score": score,
+        "total_issues": len(issues),
+        "errors": errors,
+        "warnings": warnings,
+        "issues": issues[:20],
+        "issues_detail": issues_detail
+    }
+
+
+def _categorize(issues: List[Dict]) -> Tuple[int, int, List[Dict]]:
+    """
+    Count errors/warnings and build the first 10 issue details in one pass.
+    """
+    errors = warnings = 0
+    issues_detail = []
+    for index, issue in enumerate(issues):
+        issue_type = issue.get("type")
+        if issue_type == "error":
+            errors += 1
+        elif issue_type == "warning":
+            warnings += 1
+        if index < 10:
+            issues_detail.append({
+                "line": issue.get("line"),
+                "column": issue.get("column"),
+                "type": issue_type,
+                "symbol": issue.get("symbol"),
+                "message": issue.get("message")
+            })
+    return errors, warnings, issues_detail
+
+
+def _pylint_worker(file_path: str) -> Tuple[str, object]:
+    """
+    Analyze one file and capture its outcome as ("ok" | "timeout" | "error", payload),
+    where an "ok" payload is (issues, score).
+
+    Neither logs nor caches; the caller passes the outcome to _record_analysis.
+    """
+    if _HAS_PYLINT:
+        return _run_inproc_jobs([[file_path]])[0][0]
+    try:
+        return "ok", _run_pylint_subprocess(file_path)
+    except subprocess.TimeoutExpired:
+        return "timeout", None
+    except Exception as e:
+        return "error", str(e)
+
+
+def _record_analysis(file_path: str, outcome: Tuple[str, object]) -> Dict:
+    """
+    Log a _pylint_worker outcome and turn it into the public result dict.
+    """
+    kind, payload = outcome
+
+    if kind == "ok":
+        analysis_result = _build_result(file_path, *payload)
+        log_experiment_async(
             agent_name="Toolsmith",
             model_used="pylint",
             action=ActionType.ANALYSIS,
@@ -72,17 +474,17 @@ def run_pylint_analysis(file_path: str, sandbox_dir: str = "./sandbox") -> Dict:
                 "operation": "pylint_analysis",
                 "file_path": file_path,
                 "input_prompt": f"Analyze code quality: {file_path}",
-                "output_response": json.dumps(analysis_result),
-                "score": score,
-                "total_issues": len(issues)
+                "output_response": _json.dumps(analysis_result),
+                "score": analysis_result["score"],
+                "total_issues": analysis_result["total_issues"]
             },
             status="SUCCESS"
         )
 
         return analysis_result
 
-    except subprocess.TimeoutExpired:
-        log_experiment(
+    if kind == "timeout":
+        log_experiment_async(
             agent_name="Toolsmith",
             model_used="pylint",
             action=ActionType.DEBUG,
@@ -102,33 +504,193 @@ def run_pylint_analysis(file_path: str, sandbox_dir: str = "./sandbox") -> Dict:
             "issues": []
         }
 
-    except Exception as e:
-        log_experiment(
-            agent_name="Toolsmith",
-            model_used="pylint",
-            action=ActionType.DEBUG,
-            details={
-                "operation": "pylint_analysis",
-                "file_path": file_path,
-                "input_prompt": f"Analyze code quality: {file_path}",
-                "output_response": f"Error: {str(e)}",
-                "error": str(e)
-            },
-            status="FAILURE"
-        )
-        return {
-            "file": file_path,
-            "score": 0,
-            "error": str(e),
-            "issues": []
-        }
+    log_experiment_async(
+        agent_name="Toolsmith",
+        model_used="pylint",
+        action=ActionType.DEBUG,
+        details={
+            "operation": "pylint_analysis",
+            "file_path": file_path,
+            "input_prompt": f"Analyze code quality: {file_path}",
+            "output_response": f"Error: {payload}",
+            "error": payload
+        },
+        status="FAILURE"
+    )
+    return {
+        "file": file_path,
+        "score": 0,
+        "error": payload,
+        "issues": []
+    }
+
+
+def _run_pylint_inproc(file_path: str) -> Tuple[List[Dict], float]:
+    """
+    Run pylint on one file inside this process, avoiding interpreter startup.
+
+    Raises:
+        RuntimeError: If pylint exits on a configuration or option error
+    """
+    from pylint.lint import Run
+    from pylint.reporters import JSONReporter
+
+    stream = io.StringIO()
+    try:
+        linter = Run([file_path], reporter=JSONReporter(stream), exit=False).linter
+    except SystemExit as e:
+        # Raised on bad options or config files even with exit=False
+        raise RuntimeError(f"pylint exited with status {e.code}") from None
+
+    try:
+        issues = [_normalize_issue(m) for m in _json.loads(stream.getvalue() or "[]")]
+    except _json.JSONDecodeError:
+        issues = []
+
+    # The score pylint itself reports; 0 when the file has no statements
+    score = getattr(linter.stats, "global_note", 0.0) or 0.0
+    return issues, max(0.0, float(score))
+
+
+def _evict_project_modules() -> None:
+    """
+    Drop astroid's cached modules, except the stdlib and installed packages,
+    so edits to analyzed files and to the modules they import are seen.
+    """
+    from astroid import MANAGER
+
+    cache = MANAGER.astroid_cache
+    stale = [
+        name for name, module in cache.items()
+        if getattr(module, "file", None)
+        and not os.path.abspath(module.file).startswith(_STABLE_PREFIXES)
+    ]
+    for name in stale:
+        del cache[name]
+
+
+def _run_pylint_subprocess(file_path: str) -> Tuple[List[Dict], float]:
+    """
+    Run pylint as a CLI when it cannot be imported.
+    """
+    # Single run: json2 carries both the messages and the score
+    result = run_safe(
+        ["pylint", "--output-format=json2", file_path],
+        timeout=_PYLINT_TIMEOUT
+    )
+
+    issues, score = parse_pylint_json2(result.stdout)
+    if issues is None:
+        # Older pylint without json2: fall back to JSON + text runs
+        issues, score = _run_pylint_legacy(file_path)
+    return issues, score
+
+
+async def _run_pylint_async(file_path: str, limit: asyncio.Semaphore) -> Tuple[str, object]:
+    """
+    Async _pylint_worker for the CLI path: many pylint processes in flight
+    from one thread, bounded by limit.
+    """
+    async with limit:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "pylint", "--output-format=json2", file_path,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                **new_session_kwargs()
+            )
+        except Exception as e:
+            return "error", str(e)
+
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=_PYLINT_TIMEOUT)
+        except asyncio.TimeoutError:
+            # No SIGTERM grace wait here: it would block the event loop
+            kill_tree(proc.pid, grace=0)
+            await proc.wait()
+            return "timeout", None
+
+    issues, score = parse_pylint_json2(stdout.decode("utf-8", "replace"))
+    if issues is None:
+        # Older pylint without json2: the two-run fallback stays synchronous
+        try:
+            issues, score = await asyncio.to_thread(_run_pylint_legacy, file_path)
+        except subprocess.TimeoutExpired:
+            return "timeout", None
+        except Exception as e:
+            return "error", str(e)
+
+    return "ok", (issues, score)
+
+
+async def _run_pylint_async_many(files: List[str]) -> List[Tuple[str, object]]:
+    """
+    Lint files concurrently through the pylint CLI, one process per CPU.
+    """
+    limit = asyncio.Semaphore(os.cpu_count() or 1)
+    return list(await asyncio.gather(*(_run_pylint_async(f, limit) for f in files)))
+
+
+def parse_pylint_json2(output: str) -> Tuple[Optional[List[Dict]], float]:
+    """
+    Parse pylint's json2 report into (issues, score).
+
+    Returns (None, 0.0) if output is not a json2 report.
+    """
+    try:
+        report = _json.loads(output)
+    except _json.JSONDecodeError:
+        return None, 0.0
+
+    if not isinstance(report, dict) or "messages" not in report:
+        return None, 0.0
+
+    score = report.get("statistics", {}).get("score", 0.0)
+    try:
+        score = max(0.0, float(score))
+    except (TypeError, ValueError):
+        score = 0.0
+
+    return [_normalize_issue(m) for m in report["messages"]], score
+
+
+def _normalize_issue(message: Dict) -> Dict:
+    """
+    Map a pylint message from the json or json2 format onto _ISSUE_KEYS.
+    """
+    issue = {key: message.get(key) for key in _ISSUE_KEYS}
+    if issue["message-id"] is None:
+        issue["message-id"] = message.get("messageId")
+    return issue
+
+
+def _run_pylint_legacy(file_path: str) -> Tuple[List[Dict], float]:
+    """
+    Two-pass fallback for pylint versions without the json2 format.
+    """
+    result_json = run_safe(
+        ["pylint", "--output-format=json", file_path],
+        timeout=_PYLINT_TIMEOUT
+    )
+
+    try:
+        issues = [_normalize_issue(m) for m in _json.loads(result_json.stdout)]
+    except _json.JSONDecodeError:
+        issues = []
+
+    result_text = run_safe(
+        ["pylint", file_path],
+        timeout=_PYLINT_TIMEOUT
+    )
+
+    return issues, extract_pylint_score(result_text.stdout + result_text.stderr)
 
 
 def extract_pylint_score(output: str) -> float:
     """
     Extract pylint score from output text.
     """
-    match = re.search(r"rated at ([-\d.]+)/10", output)
+    match = _SCORE_RE.search(output)
     if match:
         try:
             return max(0.0, float(match.group(1)))
@@ -137,6 +699,172 @@ def extract_pylint_score(output: str) -> float:
     return 0.0
 
 
+def _pylint_batch_worker(files: List[str]) -> List[Tuple[str, object]]:
+    """
+    In-process _pylint_worker for a chunk of files, run in a worker process.
+
+    Files are linted one pylint run each, so errors and scores stay per
+    file, while astroid's inference cache is shared across the chunk.
+    """
+    _evict_project_modules()
+    outcomes = []
+    for f in files:
+        try:
+            outcomes.append(("ok", _run_pylint_inproc(f)))
+        except Exception as e:
+            outcomes.append(("error", str(e)))
+    return outcomes
+
+
+def _get_pool():
+    """
+    The worker pool for in-process pylint, created on first use and kept
+    for later analyses.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = _POOL_CONTEXT.Pool(_POOL_SIZE)
+        return _pool
+
+
+def _discard_pool(pool) -> None:
+    """
+    Terminate pool and forget it, so the next job starts a fresh one.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.terminate()
+    pool.join()
+
+
+def _run_jobs_with_deadline(jobs: List[List[str]]) -> List[object]:
+    """
+    Run _pylint_batch_worker over jobs in the worker pool, each job allowed
+    _PYLINT_TIMEOUT seconds per file.
+
+    At most one job per worker is in flight, so a deadline starts when its
+    job starts. In-process pylint cannot be interrupted: when a job expires
+    the pool is terminated, the job gets _JOB_TIMEOUT and the other running
+    jobs start over in a fresh pool. Jobs of concurrent callers lost that
+    way are noticed within _POOL_POLL seconds and started over too.
+    """
+    results: List[object] = [None] * len(jobs)
+    todo = list(range(len(jobs)))
+    workers = min(_POOL_SIZE, len(jobs))
+
+    while todo:
+        try:
+            pool = _get_pool()
+        except OSError:
+            # No usable process pool (e.g. restricted environment): run
+            # serially in this process, without a deadline
+            for i in todo:
+                results[i] = _pylint_batch_worker(jobs[i])
+            break
+
+        done: "queue.Queue[Tuple[int, List[Tuple[str, object]]]]" = queue.Queue()
+        running: Dict[int, float] = {}
+        try:
+            while todo or running:
+                while todo and len(running) < workers:
+                    i = todo[0]
+                    try:
+                        pool.apply_async(
+                            _pylint_batch_worker, (jobs[i],),
+                            callback=lambda r, i=i: done.put((i, r)),
+                            error_callback=lambda e, i=i: done.put((i, [("error", str(e))] * len(jobs[i])))
+                        )
+                    except ValueError:
+                        break  # Terminated by another caller
+                    del todo[0]
+                    running[i] = time.monotonic() + _PYLINT_TIMEOUT * len(jobs[i])
+                if pool is not _pool:
+                    todo[:0] = sorted(running)
+                    break
+
+                wait = min(running.values()) - time.monotonic()
+                try:
+                    i, outcome = done.get(timeout=max(0.0, min(wait, _POOL_POLL)))
+                except queue.Empty:
+                    if pool is not _pool:
+                        # Another caller's job hung and took this pool down
+                        todo[:0] = sorted(running)
+                        break
+                    now = time.monotonic()
+                    expired = [i for i, deadline in running.items() if deadline <= now]
+                    if expired:
+                        for i in expired:
+                            results[i] = _JOB_TIMEOUT
+                            del running[i]
+                        todo[:0] = sorted(running)
+                        _discard_pool(pool)
+                        break
+                    continue
+                results[i] = outcome
+                del running[i]
+        except BaseException:
+            _discard_pool(pool)
+            raise
+
+    return results
+
+
+def _run_inproc_jobs(jobs: List[List[str]]) -> List[List[Tuple[str, object]]]:
+    """
+    Outcomes of _pylint_batch_worker for each job, with a deadline.
+
+    A chunk that times out is retried file by file, so only the file that
+    hangs is reported as a timeout.
+    """
+    results = _run_jobs_with_deadline(jobs)
+    retry = [[f] for job, r in zip(jobs, results) if r is _JOB_TIMEOUT and len(job) > 1 for f in job]
+    retried = iter(_run_jobs_with_deadline(retry))
+
+    outcomes = []
+    for job, r in zip(jobs, results):
+        if r is _JOB_TIMEOUT and len(job) > 1:
+            r = [next(retried) for _ in job]
+            r = [("timeout", None) if o is _JOB_TIMEOUT else o[0] for o in r]
+        elif r is _JOB_TIMEOUT:
+            r = [("timeout", None)]
+        outcomes.append(r)
+    return outcomes
+
+
+def _map_pylint_workers(files: List[str]) -> List[Tuple[str, object]]:
+    """
+    Run pylint over files, in parallel when there is more than one.
+
+    With in-process pylint, files are linted in chunks of _BATCH_SIZE per
+    worker process so astroid's inference cache is shared within a chunk.
+    """
+    if not _HAS_PYLINT:
+        return _map_pylint_cli(files)
+
+    jobs = [files[i:i + _BATCH_SIZE] for i in range(0, len(files), _BATCH_SIZE)]
+    return [outcome for chunk in _run_inproc_jobs(jobs) for outcome in chunk]
+
+
+def _map_pylint_cli(files: List[str]) -> List[Tuple[str, object]]:
+    """
+    CLI path of _map_pylint_workers: overlap pylint processes with asyncio
+    instead of a process pool that would only wait on children.
+    """
+    if len(files) <= 1:
+        return [_pylint_worker(f) for f in files]
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_run_pylint_async_many(files))
+
+    # Already inside an event loop (async caller): cannot nest asyncio.run
+    return [_pylint_worker(f) for f in files]
+
+
 def get_directory_quality_score(directory: str, sandbox_dir: str = "./sandbox") -> Dict:
     """
     Analyze all Python files in a directory.
@@ -158,8 +886,26 @@ def get_directory_quality_score(directory: str, sandbox_dir: str = "./sandbox")
     total_issues = 0
     file_analyses = []
 
+    # No per-file sandbox check: list_files only returns paths it has
+    # already validated (files resolving outside the sandbox are dropped)
+    # Reuse outcomes for unchanged files, lint only the rest
+    keys = {f: _cache_key(f, sandbox_dir) for f in files}
+    outcomes = {}
+    for f in files:
+        cached = _cache_get(keys[f])
+        if cached is not None:
+            outcomes[f] = ("ok", cached)
+    pending = [f for f in files if f not in outcomes]
+
+    # pylint is CPU-bound and holds the GIL, so fan out across processes;
+    # workers do not log, outcomes are recorded here in the parent
+    for f, outcome in zip(pending, _map_pylint_workers(pending)):
+        outcomes[f] = outcome
+        if outcome[0] == "ok":
+            _cache_put(keys[f], *outcome[1])
+
     for file_path in files:
-        analysis = run_pylint_analysis(file_path, sandbox_dir)
+        analysis = _record_analysis(file_path, outcomes[file_path])
 
         file_analyses.append({
             "file": file_path,
@@ -180,7 +926,7 @@ def get_directory_quality_score(directory: str, sandbox_dir: str = "./sandbox")
         "files": file_analyses
     }
 
-    log_experiment(
+    log_experiment_async(
         agent_name="Toolsmith",
         model_used="pylint",
         action=ActionType.ANALYSIS,
@@ -188,7 +934,7 @@ def get_directory_quality_score(directory: str, sandbox_dir: str = "./sandbox")
             "operation": "directory_quality_analysis",
             "directory": directory,
             "input_prompt": f"Analyze directory quality: {directory}",
-            "output_response": json.dumps(result),
+            "output_response": _json.dumps(result),
             "average_score": average_score,
             "file_count": len(files)
         },
@@ -3,21 +3,62 @@ Pytest Tool for Toolsmith
 Execute unit tests and provide test results
 """
 
+import copy
+import importlib.util
+import os
 import subprocess
-import json
 import re
-from typing import Dict, List, Optional
-from src.utils.logger import log_experiment, ActionType
+import sys
+import tempfile
+import threading
+import xml.etree.ElementTree as ET
+from typing import Dict, List, Optional, Tuple
+from src.utils import _json
+from src.utils.logger import log_experiment_async, ActionType
 from src.tools.sandbox_manager import is_path_in_sandbox 
+from src.tools._subprocess_safe import run_safe
 
+# One verbose result line, "path::test_name STATUS [ nn%]", or with xdist
+# "[gw0] [ nn%] STATUS path::test_name". Anchored at the line start so each
+# line is tried once, not at every "test_" inside it
+_TEST_LINE_RE = re.compile(
+    r"^(?:(?P<name>\S+::.*?)\s+(?P<status>PASSED|FAILED|SKIPPED)\b"
+    r"|\[gw\d+\]\s+\[\s*\d+%\]\s+(?P<xstatus>PASSED|FAILED|SKIPPED)\s+(?P<xname>\S+::.*?)\s*$)",
+    re.MULTILINE
+)
 
-def run_pytest(directory: str, sandbox_dir: str = "./sandbox") -> Dict:
+# Run pytest from this interpreter: no PATH lookup per call, and the tests
+# see the same virtualenv as the tools
+_PYTEST_CMD = [sys.executable, "-m", "pytest"]
+
+
+# Raw output kept in results and logs is capped to its last _MAX_LOG characters
+_MAX_LOG = 32 * 1024
+
+# Last completed run_pytest result per (directory, parallel), with the
+# sandbox tree stamp it was computed from
+_pytest_cache: Dict[Tuple[str, bool], Tuple[tuple, Dict]] = {}
+_pytest_lock = threading.Lock()
+_STAMP_SKIP_DIRS = frozenset({"__pycache__", ".git", ".pytest_cache", "venv", ".venv"})
+
+# pytest-xdist is optional; without it tests run in a single process
+_HAS_XDIST = importlib.util.find_spec("xdist") is not None
+
+
+def run_pytest(
+    directory: str,
+    sandbox_dir: str = "./sandbox",
+    parallel: bool = True,
+    use_cache: bool = True
+) -> Dict:
     """
     Run pytest on a directory and return results.
 
     Args:
         directory: Directory containing tests
         sandbox_dir: Sandbox root directory
+        parallel: Spread test files across CPU cores with pytest-xdist, if installed
+        use_cache: Reuse the last result while no file in the sandbox has changed
 
     Returns:
         Dictionary with test results
@@ -25,58 +66,28 @@ def run_pytest(directory: str, sandbox_dir: str = "./sandbox") -> Dict:
     is_path_in_sandbox(directory, sandbox_dir)
 
     try:
-        result = subprocess.run(
-            ["pytest", directory, "--tb=short", "-v", "--no-header"],
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
-
-        output = result.stdout + result.stderr
-
-        passed = len(re.findall(r"PASSED", output))
-        failed = len(re.findall(r"FAILED", output))
-        skipped = len(re.findall(r"SKIPPED", output))
-        total = passed + failed + skipped
-
-        success_rate = (passed / total * 100) if total > 0 else 0.0
+        # Stamp before running, so edits made during the run invalidate it
+        stamp = _tree_stamp(sandbox_dir) if use_cache else None
+        key = (os.path.abspath(directory), parallel)
+        test_result = _pytest_cache_get(key, stamp)
+        cached = test_result is not None
+        if not cached:
+            test_result = _execute_pytest(directory, parallel)
+            if stamp is not None:
+                _pytest_cache_put(key, stamp, test_result)
+
+        _log_pytest_run(directory, test_result, cached)
+        return test_result
 
+    except subprocess.TimeoutExpired as e:
+        # The process tree is killed but its output so far is kept: report
+        # the tests that finished before the hang
+        output = (e.output or "") + (e.stderr or "")
         tests = parse_pytest_output(output)
+        counts = _count_statuses(tests)
+        total = len(tests)
 
-        test_result = {
-            "directory": directory,
-            "passed": passed,
-            "failed": failed,
-            "skipped": skipped,
-            "total": total,
-            "success_rate": round(success_rate, 2),
-            "exit_code": result.returncode,
-            "tests": tests,
-            "error_log": output if failed > 0 else ""
-        }
-
-        status = "SUCCESS" if result.returncode == 0 else "FAILURE"
-
-        log_experiment(
-            agent_name="Toolsmith",
-            model_used="pytest",
-            action=ActionType.ANALYSIS,
-            details={
-                "operation": "pytest_run",
-                "directory": directory,
-                "input_prompt": f"Run tests: {directory}",
-                "output_response": json.dumps(test_result),
-                "passed": passed,
-                "failed": failed,
-                "total": total
-            },
-            status=status
-        )
-
-        return test_result
-
-    except subprocess.TimeoutExpired:
-        log_experiment(
+        log_experiment_async(
             agent_name="Toolsmith",
             model_used="pytest",
             action=ActionType.DEBUG,
@@ -85,23 +96,27 @@ def run_pytest(directory: str, sandbox_dir: str = "./sandbox") -> Dict:
                 "directory": directory,
                 "input_prompt": f"Run tests: {directory}",
                 "output_response": "Pytest execution timed out",
-                "error": "timeout"
+                "error": "timeout",
+                "passed": counts["PASSED"],
+                "failed": counts["FAILED"],
+                "total": total
             },
             status="FAILURE"
         )
         return {
             "directory": directory,
-            "passed": 0,
-            "failed": 0,
-            "skipped": 0,
-            "total": 0,
-            "success_rate": 0.0,
+            "passed": counts["PASSED"],
+            "failed": counts["FAILED"],
+            "skipped": counts["SKIPPED"],
+            "total": total,
+            "success_rate": round(counts["PASSED"] / total * 100, 2) if total else 0.0,
             "error": "Test execution timeout",
-            "tests": []
+            "tests": tests,
+            "error_log": _truncate_output(output)
         }
 
     except Exception as e:
-        log_experiment(
+        log_experiment_async(
             agent_name="Toolsmith",
             model_used="pytest",
             action=ActionType.DEBUG,
@@ -126,6 +141,141 @@ def run_pytest(directory: str, sandbox_dir: str = "./sandbox") -> Dict:
         }
 
 
+def _log_pytest_run(directory: str, test_result: Dict, cached: bool = False) -> None:
+    """
+    Log a completed pytest run; cached marks a result reused from an
+    earlier run, whose duration and exit code are not from a new run.
+    """
+    status = "SUCCESS" if test_result["exit_code"] == 0 else "FAILURE"
+
+    log_experiment_async(
+        agent_name="Toolsmith",
+        model_used="pytest",
+        action=ActionType.ANALYSIS,
+        details={
+            "operation": "pytest_run",
+            "directory": directory,
+            "input_prompt": f"Run tests: {directory}",
+            "output_response": _json.dumps(test_result),
+            "passed": test_result["passed"],
+            "failed": test_result["failed"],
+            "total": test_result["total"],
+            "cached": cached
+        },
+        status=status
+    )
+
+
+def _execute_pytest(
+    directory: str,
+    parallel: bool,
+    extra_args: Tuple[str, ...] = (),
+    extra_env: Optional[Dict[str, str]] = None
+) -> Dict:
+    """
+    Run pytest once and build the run_pytest result.
+
+    Raises:
+        subprocess.TimeoutExpired: If the run exceeds 60 seconds
+    """
+    # Results come from a JUnit XML report written outside the sandbox;
+    # -p no:cacheprovider also stops pytest from writing .pytest_cache
+    # into the sandbox each run
+    with tempfile.TemporaryDirectory() as report_dir:
+        report_path = os.path.join(report_dir, "report.xml")
+        cmd = [*_PYTEST_CMD, directory, "--tb=short", "-v", "--no-header",
+               "-p", "no:cacheprovider", f"--junitxml={report_path}",
+               # xunit1 records each test's file, to rebuild its node ID
+               "-o", "junit_family=xunit1"]
+        if parallel and _HAS_XDIST:
+            # loadfile keeps each file's tests in one worker, so module
+            # level fixtures and state behave as in a serial run
+            cmd.extend(["-n", str(os.cpu_count() or 2), "--dist=loadfile"])
+        cmd.extend(extra_args)
+        result = run_safe(cmd, timeout=60, env={**_pytest_env(), **(extra_env or {})})
+        tests = parse_junit_xml(report_path, directory)
+
+    output = (result.stdout or "") + (result.stderr or "")
+
+    # Older or plugin-less pytest runs may not leave a report behind;
+    # fall back to scraping the verbose output
+    if tests is None:
+        tests = parse_pytest_output(output)
+    counts = _count_statuses(tests)
+    passed = counts["PASSED"]
+    failed = counts["FAILED"]
+    skipped = counts["SKIPPED"]
+    total = passed + failed + skipped
+
+    success_rate = (passed / total * 100) if total > 0 else 0.0
+
+    test_result = {
+        "directory": directory,
+        "passed": passed,
+        "failed": failed,
+        "skipped": skipped,
+        "total": total,
+        "success_rate": round(success_rate, 2),
+        "exit_code": result.returncode,
+        "tests": tests,
+        "error_log": _truncate_output(output) if failed > 0 else ""
+    }
+
+    return test_result
+
+
+def _tree_stamp(root: str) -> Tuple[Tuple[str, int, int], ...]:
+    """
+    (path, mtime_ns, size) of every file under root, sorted.
+
+    Any edit, addition or removal in the tree changes the stamp. Data and
+    config files count too, since tests can depend on them.
+    """
+    stamp = []
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _STAMP_SKIP_DIRS:
+                            stack.append(entry.path)
+                    else:
+                        try:
+                            st = entry.stat()
+                        except OSError:
+                            continue
+                        stamp.append((entry.path, st.st_mtime_ns, st.st_size))
+        except OSError:
+            continue
+    stamp.sort()
+    return tuple(stamp)
+
+
+def _pytest_cache_get(key: Tuple[str, bool], stamp) -> Optional[Dict]:
+    """
+    Deep copy of the cached result for key if its tree stamp still matches,
+    so callers may mutate it (e.g. result["tests"]) freely.
+    """
+    if stamp is None:
+        return None
+    with _pytest_lock:
+        entry = _pytest_cache.get(key)
+    if entry is not None and entry[0] == stamp:
+        return copy.deepcopy(entry[1])
+    return None
+
+
+def _pytest_cache_put(key: Tuple[str, bool], stamp, test_result: Dict) -> None:
+    """
+    Remember a completed run; timeouts and errors never reach here.
+    """
+    snapshot = copy.deepcopy(test_result)
+    with _pytest_lock:
+        _pytest_cache[key] = (stamp, snapshot)
+
+
 def run_single_test(
     test_file: str,
     test_name: Optional[str] = None,
@@ -137,22 +287,22 @@ def run_single_test(
     is_path_in_sandbox(test_file, sandbox_dir)
 
     try:
-        cmd = ["pytest", test_file, "-v", "--tb=short"]
+        cmd = [*_PYTEST_CMD, test_file, "-v", "--tb=short", "-p", "no:cacheprovider"]
 
         if test_name:
             cmd.extend(["-k", test_name])
 
-        result = subprocess.run(
+        result = run_safe(
             cmd,
-            capture_output=True,
-            text=True,
-            timeout=30
+            timeout=30,
+            env=_pytest_env()
         )
 
-        output = result.stdout + result.stderr
+        output = (result.stdout or "") + (result.stderr or "")
 
-        passed = len(re.findall(r"PASSED", output))
-        failed = len(re.findall(r"FAILED", output))
+        counts = _count_statuses(parse_pytest_output(output))
+        passed = counts["PASSED"]
+        failed = counts["FAILED"]
 
         test_result = {
             "test_file": test_file,
@@ -160,10 +310,10 @@ def run_single_test(
             "passed": passed,
             "failed": failed,
             "success": passed > 0 and failed == 0,
-            "output": output
+            "output": _truncate_output(output)
         }
 
-        log_experiment(
+        log_experiment_async(
             agent_name="Toolsmith",
             model_used="pytest",
             action=ActionType.ANALYSIS,
@@ -175,7 +325,7 @@ def run_single_test(
                     f"Run test: {test_file}::{test_name}"
                     if test_name else f"Run tests: {test_file}"
                 ),
-                "output_response": json.dumps(test_result),
+                "output_response": _json.dumps(test_result),
                 "passed": passed,
                 "failed": failed
             },
@@ -185,7 +335,7 @@ def run_single_test(
         return test_result
 
     except Exception as e:
-        log_experiment(
+        log_experiment_async(
             agent_name="Toolsmith",
             model_used="pytest",
             action=ActionType.DEBUG,
@@ -214,17 +364,110 @@ def parse_pytest_output(output: str) -> List[Dict]:
     Parse pytest output to extract individual test results.
     """
     tests = []
-    pattern = r"(test_\w+.*?)\s+(PASSED|FAILED|SKIPPED)"
 
-    for match in re.finditer(pattern, output):
+    for match in _TEST_LINE_RE.finditer(output):
+        tests.append({
+            "name": (match["name"] or match["xname"]).strip(),
+            "status": match["status"] or match["xstatus"]
+        })
+
+    return tests
+
+
+def parse_junit_xml(report_path: str, directory: str = ".") -> Optional[List[Dict]]:
+    """
+    Parse a pytest --junitxml report into individual test results.
+
+    directory is the one pytest was run on, used to rebuild node IDs.
+    Returns None if the report is missing or unreadable.
+    """
+    try:
+        root = ET.parse(report_path).getroot()
+    except (OSError, ET.ParseError):
+        return None
+
+    tests = []
+    for case in root.iter("testcase"):
+        if case.find("failure") is not None or case.find("error") is not None:
+            status = "FAILED"
+        elif case.find("skipped") is not None:
+            status = "SKIPPED"
+        else:
+            status = "PASSED"
         tests.append({
-            "name": match.group(1).strip(),
-            "status": match.group(2)
+            "name": _junit_node_id(
+                case.get("file"), case.get("classname"), case.get("name", ""), directory
+            ),
+            "status": status
         })
 
     return tests
 
 
+def _junit_node_id(
+    file: Optional[str], classname: Optional[str], name: str, directory: str = "."
+) -> str:
+    """
+    Rebuild the pytest node ID ("path/test_a.py::TestX::test_one") of a
+    JUnit test case, the form the console output uses and pytest accepts.
+
+    classname is dotted ("path.test_a.TestX"); the module part is found from
+    the file attribute, or else by looking for the matching .py file
+    relative to pytest's rootdir. The rootdir is the directory that was run
+    or one of its ancestors, so those are searched, not the process CWD.
+    """
+    if not classname:
+        return name
+    parts = classname.split(".")
+
+    if file:
+        file = file.replace(os.sep, "/")
+        module = file[:-3].replace("/", ".") if file.endswith(".py") else None
+        if module and (classname == module or classname.startswith(module + ".")):
+            return "::".join([file, *classname[len(module):].split(".")[1:], name])
+
+    bases = []
+    base = os.path.abspath(directory)
+    while base not in bases:
+        bases.append(base)
+        base = os.path.dirname(base)
+
+    for end in range(len(parts), 0, -1):
+        path = "/".join(parts[:end]) + ".py"
+        if any(os.path.isfile(os.path.join(base, path)) for base in bases):
+            return "::".join([path, *parts[end:], name])
+
+    return f"{classname}::{name}"
+
+
+def _pytest_env() -> Dict[str, str]:
+    """
+    Environment for pytest runs; sandbox runs are throwaway, so skip
+    writing .pyc files for them. Unbuffered output means a run killed on
+    timeout has still written every result line it got to.
+    """
+    return {**os.environ, "PYTHONDONTWRITEBYTECODE": "1", "PYTHONUNBUFFERED": "1"}
+
+
+def _truncate_output(output: str) -> str:
+    """
+    Keep the tail of long pytest output, where the failure summary is.
+    """
+    if len(output) <= _MAX_LOG:
+        return output
+    return f"...[truncated {len(output) - _MAX_LOG} chars]...\n" + output[-_MAX_LOG:]
+
+
+def _count_statuses(tests: List[Dict]) -> Dict[str, int]:
+    """
+    Tally parsed tests by status.
+    """
+    counts = {"PASSED": 0, "FAILED": 0, "SKIPPED": 0}
+    for test in tests:
+        counts[test["status"]] += 1
+    return counts
+
+
 def get_test_coverage(directory: str, sandbox_dir: str = "./sandbox") -> Dict:
     """
     Run pytest with coverage analysis if available.
@@ -232,30 +475,48 @@ def get_test_coverage(directory: str, sandbox_dir: str = "./sandbox") -> Dict:
     is_path_in_sandbox(directory, sandbox_dir)
 
     try:
-        result = subprocess.run(
-            ["pytest", directory, "--cov", "--cov-report=json"],
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
-
-        output = result.stdout + result.stderr
-        test_result = run_pytest(directory, sandbox_dir)
-
+        # Test results come from the coverage run itself; coverage data and
+        # report go to a temporary directory, not the working directory
+        with tempfile.TemporaryDirectory() as cov_dir:
+            cov_report = os.path.join(cov_dir, "coverage.json")
+            test_result = _execute_pytest(
+                directory,
+                parallel=True,
+                extra_args=("--cov", f"--cov-report=json:{cov_report}"),
+                extra_env={"COVERAGE_FILE": os.path.join(cov_dir, ".coverage")}
+            )
+            coverage_available = os.path.exists(cov_report)
+
+        # Exit code 4 is a usage error, e.g. --cov without pytest-cov
+        if test_result["exit_code"] == 4:
+            return {**run_pytest(directory, sandbox_dir), "coverage_available": False}
+
+        _log_pytest_run(directory, test_result)
         return {
             **test_result,
-            "coverage_available": ".coverage.json" in output
+            "coverage_available": coverage_available
         }
 
     except Exception:
-        return run_pytest(directory, sandbox_dir)
+        return {**run_pytest(directory, sandbox_dir), "coverage_available": False}
 
 
-def get_failing_tests(directory: str, sandbox_dir: str = "./sandbox") -> Dict:
+def get_failing_tests(
+    directory: Optional[str] = None,
+    sandbox_dir: str = "./sandbox",
+    *,
+    result: Optional[Dict] = None
+) -> Dict:
     """
     Get list of failing tests with error details.
+
+    Pass result to reuse an existing run_pytest result instead of running
+    the tests again; otherwise directory is required.
     """
-    result = run_pytest(directory, sandbox_dir)
+    if result is None:
+        if directory is None:
+            raise ValueError("get_failing_tests needs a directory or a result")
+        result = run_pytest(directory, sandbox_dir)
 
     failing_tests = [
         test for test in result.get("tests", [])
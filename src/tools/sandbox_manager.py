@@ -4,6 +4,7 @@ Ensures all file operations are restricted to the sandbox directory.
 """
 
 import os
+from typing import Dict, Tuple
 
 
 class SecurityError(Exception):
@@ -11,28 +12,85 @@ class SecurityError(Exception):
     pass
 
 
-def is_path_in_sandbox(path: str, sandbox_dir: str = "./sandbox") -> bool:
+# Resolved sandbox roots, keyed by absolute sandbox_dir: (root, root + sep).
+# Only roots are cached; every checked path is resolved again
+_SANDBOX_ROOTS: Dict[str, Tuple[str, str]] = {}
+
+
+def _sandbox_root(sandbox_dir: str) -> Tuple[str, str]:
+    """Resolve a sandbox root once and reuse it on every later check."""
+    key = os.path.abspath(sandbox_dir)
+    root = _SANDBOX_ROOTS.get(key)
+    if root is None:
+        abs_sandbox = os.path.realpath(key)
+        root = (abs_sandbox, os.path.join(abs_sandbox, ""))
+        _SANDBOX_ROOTS[key] = root
+    return root
+
+
+def _resolve_validated(abs_path: str, sandbox_key: str) -> str:
+    """Resolve one path (never cached) and check it against the cached sandbox root."""
+    # Resolve symlinks on every call: a directory validated earlier can
+    # since have been replaced by a symlink pointing outside the sandbox.
+    # realpath already returns an absolute, normalized path
+    resolved = os.path.realpath(abs_path)
+    abs_sandbox, abs_sandbox_sep = _sandbox_root(sandbox_key)
+    
+    # Separator-terminated prefix prevents false positives (e.g., /sandbox vs /sandbox_evil)
+    if not (resolved == abs_sandbox or resolved.startswith(abs_sandbox_sep)):
+        raise SecurityError(resolved)
+    return resolved
+
+
+def invalidate_root_cache() -> None:
     """
-    Check if path is strictly inside sandbox.
+    Forget resolved sandbox roots.
+    
+    Call after operations that can change how a sandbox root resolves
+    (e.g. creating or moving the sandbox directory).
+    """
+    _SANDBOX_ROOTS.clear()
+
+
+def resolve_in_sandbox(path: str, sandbox_dir: str = "./sandbox") -> str:
+    """
+    Resolve a path and check that it is strictly inside sandbox.
     
     Args:
         path: Path to check
         sandbox_dir: Sandbox root directory
         
     Returns:
-        True if path is inside sandbox, False otherwise
+        Fully resolved absolute path
         
     Raises:
         SecurityError: If path is outside sandbox
     """
-    # Resolve symlinks and normalize paths to prevent bypass attempts
-    abs_path = os.path.normpath(os.path.abspath(os.path.realpath(path)))
-    abs_sandbox = os.path.normpath(os.path.abspath(os.path.realpath(sandbox_dir)))
-    
-    # Add separator to prevent false positives (e.g., /sandbox vs /sandbox_evil)
-    if not (abs_path.startswith(abs_sandbox + os.sep) or abs_path == abs_sandbox):
+    abs_path = os.path.abspath(path)
+    sandbox_key = os.path.abspath(sandbox_dir)
+    try:
+        return _resolve_validated(abs_path, sandbox_key)
+    except SecurityError:
+        abs_sandbox = _sandbox_root(sandbox_key)[0]
         raise SecurityError(
             f"❌ SECURITY VIOLATION: Path '{path}' is outside sandbox! "
             f"Only paths within '{abs_sandbox}' are allowed."
-        )
+        ) from None
+
+
+def is_path_in_sandbox(path: str, sandbox_dir: str = "./sandbox") -> bool:
+    """
+    Check if path is strictly inside sandbox.
+    
+    Args:
+        path: Path to check
+        sandbox_dir: Sandbox root directory
+        
+    Returns:
+        True if path is inside sandbox, False otherwise
+        
+    Raises:
+        SecurityError: If path is outside sandbox
+    """
+    resolve_in_sandbox(path, sandbox_dir)
     return True
@@ -0,0 +1,58 @@
+"""
+JSON helpers: orjson when installed, stdlib json otherwise.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _std_dumps(obj, indent: bool = False) -> str:
+    """Stdlib encoder with the same conventions as the orjson path."""
+    return json.dumps(
+        obj, default=str, ensure_ascii=False, indent=2 if indent else None
+    )
+
+
+if orjson is not None:
+    _OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def loads(data):
+        """Parse JSON from str or bytes."""
+        return orjson.loads(data)
+
+    # orjson rejects what stdlib json accepts (e.g. ints beyond 64 bits):
+    # those objects go through the stdlib encoder instead of failing
+
+    def dumpb(obj, indent: bool = False) -> bytes:
+        """Serialize to UTF-8 JSON bytes, 2-space indented if indent; unknown types use str()."""
+        option = _OPTIONS | orjson.OPT_INDENT_2 if indent else _OPTIONS
+        try:
+            return orjson.dumps(obj, default=str, option=option)
+        except TypeError:
+            return _std_dumps(obj, indent).encode("utf-8")
+
+    def dumps(obj) -> str:
+        """Serialize to a compact JSON string; unknown types use str()."""
+        try:
+            return orjson.dumps(obj, default=str, option=_OPTIONS).decode("utf-8")
+        except TypeError:
+            return _std_dumps(obj)
+else:
+    def loads(data):
+        """Parse JSON from str or bytes."""
+        return json.loads(data)
+
+    def dumpb(obj, indent: bool = False) -> bytes:
+        """Serialize to UTF-8 JSON bytes, 2-space indented if indent; unknown types use str()."""
+        return _std_dumps(obj, indent).encode("utf-8")
+
+    def dumps(obj) -> str:
+        """Serialize to a JSON string; unknown types use str()."""
+        return _std_dumps(obj)
+
+# orjson.JSONDecodeError subclasses this, so one except clause covers both
+JSONDecodeError = json.JSONDecodeError
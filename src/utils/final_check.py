@@ -2,9 +2,10 @@
 Final pre-submission validation checks.
 """
 
-import json
 import sys
+from src.utils import _json
 from src.utils.log_validator import validate_log_file
+from src.utils.logger import LOG_FILE, iter_experiments
 
 def run_final_checks() -> bool:
     """
@@ -29,26 +30,33 @@ def run_final_checks() -> bool:
         all_passed = False
     
     # Check 2: All experiments have required fields
+    # One pass over the log file as submitted collects everything checks 2
+    # and 3 need; the file is only read, never regenerated here
     print("\n2️⃣ Checking experiment completeness...")
+    agents = set()
     try:
-        with open("logs/experiment_data.json", 'r') as f:
-            data = json.load(f)
+        with open(LOG_FILE, 'rb') as f:
+            experiments = _json.loads(f.read()).get("experiments", [])
         
-        experiments = data.get("experiments", [])
-        if len(experiments) == 0:
+        count = 0
+        missing_prompts = 0
+        missing_responses = 0
+        ids = set()
+        for exp in experiments:
+            count += 1
+            ids.add(exp.get("id"))
+            details = exp.get("details", {})
+            if "input_prompt" not in details:
+                missing_prompts += 1
+            if "output_response" not in details:
+                missing_responses += 1
+            agents.add(exp.get("agent_name", "unknown"))
+        
+        if count == 0:
             print("   ❌ FAILED: No experiments logged!")
             all_passed = False
         else:
-            print(f"   ✅ Found {len(experiments)} experiments")
-            
-            # Check each has input_prompt and output_response
-            missing_prompts = 0
-            missing_responses = 0
-            for exp in experiments:
-                if "input_prompt" not in exp.get("details", {}):
-                    missing_prompts += 1
-                if "output_response" not in exp.get("details", {}):
-                    missing_responses += 1
+            print(f"   ✅ Found {count} experiments")
             
             if missing_prompts > 0:
                 print(f"   ❌ FAILED: {missing_prompts} experiments missing input_prompt")
@@ -59,6 +67,13 @@ def run_final_checks() -> bool:
             
             if missing_prompts == 0 and missing_responses == 0:
                 print("   ✅ All experiments have required fields")
+
+        # The submitted file is regenerated from the journal: entries only
+        # in the journal mean it is out of date
+        stale = sum(1 for exp in iter_experiments() if exp.get("id") not in ids)
+        if stale:
+            print(f"   ❌ FAILED: {stale} logged experiments missing from {LOG_FILE} (out of date)")
+            all_passed = False
     
     except Exception as e:
         print(f"   ❌ FAILED: {e}")
@@ -66,20 +81,12 @@ def run_final_checks() -> bool:
     
     # Check 3: Agents are represented
     print("\n3️⃣ Checking agent participation...")
-    try:
-        agents = set()
-        for exp in experiments:
-            agents.add(exp.get("agent_name", "unknown"))
-        
-        expected_agents = ["Auditor_Agent", "Fixer_Agent", "Judge_Agent"]
-        for agent in expected_agents:
-            if agent in agents:
-                print(f"   ✅ {agent} present")
-            else:
-                print(f"   ⚠️  WARNING: {agent} not found in logs")
-    
-    except Exception as e:
-        print(f"   ❌ FAILED: {e}")
+    expected_agents = ["Auditor_Agent", "Fixer_Agent", "Judge_Agent"]
+    for agent in expected_agents:
+        if agent in agents:
+            print(f"   ✅ {agent} present")
+        else:
+            print(f"   ⚠️  WARNING: {agent} not found in logs")
     
     # Final verdict
     print("\n" + "=" * 60)
@@ -2,9 +2,24 @@
 JSON Schema validation for experiment logs.
 """
 
-import json
+import os
 from typing import Optional
 
+from src.utils import _json
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+# Log files above this size are validated as a stream (needs ijson)
+_STREAM_THRESHOLD = 1_000_000
+
 LOG_SCHEMA = {
     "type": "object",
     "required": ["experiments"],
@@ -39,10 +54,57 @@ LOG_SCHEMA = {
 }
 
 
+_EXPERIMENT_SCHEMA = LOG_SCHEMA["properties"]["experiments"]["items"]
+REQUIRED_FIELDS = frozenset(_EXPERIMENT_SCHEMA["required"])
+REQUIRED_DETAILS = frozenset(_EXPERIMENT_SCHEMA["properties"]["details"]["required"])
+
+# Schema compiled once into specialized validators; the hand-written checks
+# below still name the offending experiment when these reject a log
+if fastjsonschema is not None:
+    _VALIDATE = fastjsonschema.compile(LOG_SCHEMA)
+    _VALIDATE_EXPERIMENT = fastjsonschema.compile(_EXPERIMENT_SCHEMA)
+else:
+    _VALIDATE = _VALIDATE_EXPERIMENT = None
+
+
+def _check_experiment(idx: int, exp: dict) -> Optional[str]:
+    """
+    Describe what is wrong with one experiment, or None if it is valid.
+    """
+    schema_error = None
+    if _VALIDATE_EXPERIMENT is not None:
+        try:
+            _VALIDATE_EXPERIMENT(exp)
+            return None
+        except fastjsonschema.JsonSchemaException as e:
+            schema_error = e.message
+
+    missing = REQUIRED_FIELDS - exp.keys()
+    if missing:
+        return f"Experiment {idx}: missing {', '.join(repr(f) for f in sorted(missing))}"
+    
+    if not isinstance(exp["details"], dict):
+        return f"Experiment {idx}: 'details' must be an object"
+    missing = REQUIRED_DETAILS - exp["details"].keys()
+    if missing:
+        return (
+            f"Experiment {idx}: missing "
+            f"{', '.join(repr(f) for f in sorted(missing))} in details"
+        )
+    if schema_error:
+        # Present but of the wrong type, which only the schema checks
+        return f"Experiment {idx}: {schema_error}"
+    return None
+
+
 def validate_log_file(filepath: str = "logs/experiment_data.json") -> tuple[bool, Optional[str]]:
     """
     Validate the log file against the schema.
     
+    Large files are streamed with ijson when it is installed, so memory
+    stays flat and validation stops at the first invalid experiment.
+    With fastjsonschema installed, field types are checked too.
+    
     Args:
         filepath: Path to log file
     
@@ -50,8 +112,20 @@ def validate_log_file(filepath: str = "logs/experiment_data.json") -> tuple[bool
         Tuple of (is_valid, error_message)
     """
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if ijson is not None and os.path.getsize(filepath) > _STREAM_THRESHOLD:
+            with open(filepath, 'rb') as f:
+                count = 0
+                for idx, exp in enumerate(ijson.items(f, "experiments.item")):
+                    error = _check_experiment(idx, exp)
+                    if error:
+                        return False, error
+                    count += 1
+            if count:
+                return True, None
+            # Nothing streamed: fall through for the structure errors below
+
+        with open(filepath, 'rb') as f:
+            data = _json.loads(f.read())
         
         # Basic structure check
         if "experiments" not in data:
@@ -60,28 +134,30 @@ def validate_log_file(filepath: str = "logs/experiment_data.json") -> tuple[bool
         if not isinstance(data["experiments"], list):
             return False, "'experiments' must be a list"
         
+        # Whole log in one compiled call; only a rejected log is re-walked
+        # below to report which experiment is at fault
+        if _VALIDATE is not None:
+            try:
+                _VALIDATE(data)
+                return True, None
+            except fastjsonschema.JsonSchemaException:
+                pass
+        
         # Validate each experiment
         for idx, exp in enumerate(data["experiments"]):
-            # Check required top-level fields
-            required = ["id", "timestamp", "agent_name", "model_used", 
-                       "action", "details", "status"]
-            for field in required:
-                if field not in exp:
-                    return False, f"Experiment {idx}: missing '{field}'"
-            
-            # Check details has required fields
-            if "input_prompt" not in exp["details"]:
-                return False, f"Experiment {idx}: missing 'input_prompt' in details"
-            if "output_response" not in exp["details"]:
-                return False, f"Experiment {idx}: missing 'output_response' in details"
+            error = _check_experiment(idx, exp)
+            if error:
+                return False, error
         
         return True, None
         
     except FileNotFoundError:
         return False, f"File not found: {filepath}"
-    except json.JSONDecodeError as e:
+    except _json.JSONDecodeError as e:
         return False, f"Invalid JSON: {e}"
     except Exception as e:
+        if ijson is not None and isinstance(e, ijson.JSONError):
+            return False, f"Invalid JSON: {e}"
         return False, f"Validation error: {e}"
 
 
@@ -16,16 +16,59 @@ import uuid
 # ... rest of your code
 
 
+import atexit
 import json
 import os
+import threading
+import time
 import uuid
+from collections import Counter
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Any, Iterator
+
+from src.utils import _json
+from src.utils.log_validator import REQUIRED_FIELDS, REQUIRED_DETAILS
 
-# Chemin du fichier de logs
+# Chemin du fichier de logs (format agrégé {"experiments": [...]} attendu au rendu)
 LOG_FILE = os.path.join("logs", "experiment_data.json")
 
+# Journal en ajout seul (une entrée JSON par ligne) : écrire une entrée ne
+# demande plus de relire et réécrire tout l'historique. LOG_FILE est
+# régénéré à partir de ce journal par flush_to_json().
+LOG_FILE_JSONL = os.path.join("logs", "experiment_data.jsonl")
+_LOG_INITIALIZED = False
+_LOG_MIGRATED = False
+_LOG_DIRTY = False
+
+# Sérialise les lectures-écritures du fichier de logs entre threads
+_LOG_LOCK = threading.Lock()
+
+# Tampon unique des lignes JSONL en attente, dans l'ordre des appels :
+# log_experiment et log_experiment_async y ajoutent leurs entrées, déjà
+# sérialisées (une entrée invalide échoue chez l'appelant et les
+# modifications ultérieures de 'details' sont sans effet). Il est écrit par
+# lots de _FLUSH_EVERY par log_experiment, ou par le thread d'écriture.
+_BUFFER: list[str] = []
+_BUFFER_LOCK = threading.Lock()
+_FLUSH_EVERY = 64
+
+# Thread d'écriture, réveillé par _LOG_WAKE (log_experiment_async) et au
+# moins toutes les _FLUSH_INTERVAL secondes : un arrêt brutal du processus
+# perd au plus une seconde d'entrées. LOG_FILE est régénéré au plus toutes
+# les _JSON_INTERVAL secondes tant que le journal a changé.
+_LOG_WAKE = threading.Event()
+_FLUSH_INTERVAL = 1.0
+_JSON_INTERVAL = 5.0
+_log_worker = None
+
+# Une seule régénération de LOG_FILE à la fois (thread d'écriture, atexit)
+_JSON_LOCK = threading.Lock()
+
+# Compteurs de get_experiment_stats : (inode du journal, octets lus, compteurs)
+_STATS_CACHE = None
+_STATS_LOCK = threading.Lock()
+
 class ActionType(str, Enum):
     """
     Énumération des types d'actions possibles pour standardiser l'analyse.
@@ -37,11 +80,27 @@ class ActionType(str, Enum):
 
 
 def _ensure_log_file():
-    """S'assure que le fichier de log existe avec la structure correcte."""
-    os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
-    if not os.path.exists(LOG_FILE):
-        with open(LOG_FILE, 'w', encoding='utf-8') as f:
-            json.dump({"experiments": []}, f, indent=2)
+    """S'assure que le dossier de logs existe (vérifié une seule fois)."""
+    global _LOG_INITIALIZED
+    if _LOG_INITIALIZED:
+        return
+    os.makedirs(os.path.dirname(LOG_FILE_JSONL), exist_ok=True)
+    _LOG_INITIALIZED = True
+
+
+def reset_log_state():
+    """
+    Oublie l'état mis en cache sur les fichiers de logs (dossier créé,
+    migration faite, statistiques), par ex. après avoir changé LOG_FILE ou le dossier
+    courant dans un test.
+    """
+    global _LOG_INITIALIZED, _LOG_MIGRATED, _STATS_CACHE
+    flush_logs()
+    with _LOG_LOCK:
+        _LOG_INITIALIZED = False
+        _LOG_MIGRATED = False
+    with _STATS_LOCK:
+        _STATS_CACHE = None
 
 
 def log_experiment(
@@ -68,6 +127,14 @@ def log_experiment(
     Raises:
         ValueError: Si les champs obligatoires sont manquants dans 'details'.
 
+    Note:
+        Les valeurs de 'details' non sérialisables en JSON sont enregistrées
+        sous forme de chaîne (str()).
+
+        Les entrées sont écrites par lots de _FLUSH_EVERY ; flush_logs()
+        force l'écriture (fait automatiquement à la fin du processus et
+        avant toute lecture des logs).
+
     Example:
         >>> log_experiment(
         ...     agent_name="Auditor_Agent",
@@ -81,6 +148,49 @@ def log_experiment(
         'uuid-1234-5678-...'
     """
     
+    entry = _build_entry(agent_name, model_used, action, details, status)
+    line = _dump_line(entry)
+    with _BUFFER_LOCK:
+        _BUFFER.append(line)
+        full = len(_BUFFER) >= _FLUSH_EVERY
+    _start_log_worker()
+    if full:
+        _flush()
+    return entry["id"]
+
+
+def _flush() -> None:
+    """
+    Écrit en une fois les entrées en attente dans _BUFFER.
+
+    Le tampon est vidé et écrit sous _LOG_LOCK : deux écritures ne peuvent
+    pas se croiser, le journal garde l'ordre des appels.
+    """
+    global _LOG_DIRTY
+    with _LOG_LOCK:
+        with _BUFFER_LOCK:
+            # Même en cas d'erreur d'E/S : ne pas réécrire ces lignes au
+            # prochain essai
+            lines = _BUFFER.copy()
+            _BUFFER.clear()
+        if not lines:
+            return
+        _ensure_log_file()
+        _migrate_legacy_log()
+        with open(LOG_FILE_JSONL, 'a', encoding='utf-8', buffering=1 << 16) as f:
+            f.writelines(lines)
+        _LOG_DIRTY = True
+
+
+def _build_entry(
+    agent_name: str,
+    model_used: str,
+    action: ActionType,
+    details: dict[str, Any],
+    status: str
+) -> dict:
+    """Valide les paramètres et construit l'entrée de log (sans écriture)."""
+
     # --- 1. VALIDATION DU TYPE D'ACTION ---
     valid_actions = [a.value for a in ActionType]
     if isinstance(action, ActionType):
@@ -110,11 +220,8 @@ def log_experiment(
         )
 
     # --- 3. PRÉPARATION DE L'ENTRÉE ---
-    _ensure_log_file()
-    
-    experiment_id = str(uuid.uuid4())
-    entry = {
-        "id": experiment_id,
+    return {
+        "id": str(uuid.uuid4()),
         "timestamp": datetime.now().isoformat(),
         "agent_name": agent_name,     # Nom de champ conforme
         "model_used": model_used,     # Nom de champ conforme
@@ -123,28 +230,284 @@ def log_experiment(
         "status": status
     }
 
-    # --- 4. LECTURE & ÉCRITURE ROBUSTE ---
+
+def _read_legacy_json() -> list[dict]:
+    """
+    Lit les expériences de l'ancien fichier JSON agrégé (LOG_FILE).
+
+    Raises:
+        ValueError: Si LOG_FILE existe mais n'est pas du JSON valide
+                    (ex. conflit de fusion) : il ne doit pas être écrasé.
+    """
     try:
-        with open(LOG_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Si l'ancien format (array) existe, on convertit
-        if isinstance(data, list):
-            print("⚠️ Conversion de l'ancien format vers le nouveau format...")
-            data = {"experiments": data}
-            
-    except (json.JSONDecodeError, FileNotFoundError):
-        print(f"⚠️ Le fichier de logs était vide ou corrompu. Création d'un nouveau.")
-        data = {"experiments": []}
-
-    # Ajouter la nouvelle expérience
-    data["experiments"].append(entry)
-    
-    # Écriture
-    with open(LOG_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    
-    return experiment_id
+        with open(LOG_FILE, 'rb') as f:
+            raw = f.read()
+    except FileNotFoundError:
+        return []
+    if not raw.strip():
+        return []
+    try:
+        data = _json.loads(raw)
+    except _json.JSONDecodeError as e:
+        raise ValueError(
+            f"❌ Le fichier de logs {LOG_FILE} est corrompu ({e}). "
+            f"Corrigez-le à la main : il ne sera pas régénéré."
+        ) from None
+
+    # Si l'ancien format (array) existe, on convertit
+    if isinstance(data, list):
+        print("⚠️ Conversion de l'ancien format vers le nouveau format...")
+        return data
+    return data.get("experiments", [])
+
+
+def _migrate_legacy_log() -> None:
+    """
+    Au premier ajout, reprend dans le journal JSONL les expériences d'un
+    LOG_FILE existant. Appeler avec _LOG_LOCK verrouillé.
+    """
+    global _LOG_MIGRATED
+    if _LOG_MIGRATED:
+        return
+    if not os.path.exists(LOG_FILE_JSONL):
+        try:
+            legacy = _read_legacy_json()
+        except ValueError as e:
+            # Le journal démarre sans l'historique ; flush_to_json refusera
+            # d'écraser LOG_FILE tant qu'il n'est pas réparé
+            print(e, file=sys.stderr)
+            legacy = []
+        if legacy:
+            with open(LOG_FILE_JSONL, 'a', encoding='utf-8') as f:
+                f.writelines(_dump_line(exp) for exp in legacy)
+    _LOG_MIGRATED = True
+
+
+def _dump_line(entry: dict) -> str:
+    """Sérialise une entrée sur une ligne du journal JSONL."""
+    return _json.dumps(entry) + "\n"
+
+
+def iter_experiments() -> Iterator[dict]:
+    """
+    Parcourt les expériences loggées une à une, ligne par ligne depuis le
+    journal JSONL, ou depuis l'ancien LOG_FILE s'il n'y a pas encore de
+    journal. Les entrées encore en tampon sont écrites avant la lecture.
+    """
+    flush_logs()
+    if not os.path.exists(LOG_FILE_JSONL):
+        yield from _read_legacy_json()
+        return
+
+    with open(LOG_FILE_JSONL, 'rb') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield _json.loads(line)
+            except _json.JSONDecodeError:
+                # Ligne tronquée (ex. arrêt brutal pendant l'écriture)
+                continue
+
+
+def _load_all() -> list[dict]:
+    """Lit toutes les expériences loggées (voir iter_experiments)."""
+    # Pas de verrou : le journal est en ajout seul et une ligne en cours
+    # d'écriture est ignorée comme tronquée
+    return list(iter_experiments())
+
+
+def _experiment_key(exp: dict) -> str:
+    """Identifie une expérience : son id, ou son contenu si elle n'en a pas."""
+    return exp.get("id") or _json.dumps(exp)
+
+
+def flush_to_json() -> str:
+    """
+    Écrit LOG_FILE au format agrégé {"experiments": [...]} à partir du
+    journal JSONL, pour les outils qui lisent ce format (final_check,
+    log_validator). Appelé automatiquement à la fin du processus.
+
+    LOG_FILE n'est jamais écrasé s'il est illisible ou s'il contient des
+    expériences absentes du journal (ex. journal local plus ancien que le
+    LOG_FILE récupéré par git). Le thread d'écriture le régénère aussi
+    périodiquement ; main.py l'appelle en fin d'exécution pour que cette
+    erreur fasse échouer le programme.
+
+    Returns:
+        str: Le chemin du fichier écrit
+
+    Raises:
+        ValueError: Si LOG_FILE est corrompu ou contient des expériences
+                    absentes du journal (LOG_FILE est laissé tel quel).
+    """
+    global _LOG_DIRTY
+    with _JSON_LOCK:
+        try:
+            return _write_json()
+        except Exception:
+            # LOG_FILE n'a pas été écrit : il reste à régénérer
+            _LOG_DIRTY = True
+            raise
+
+
+def _write_json() -> str:
+    """Corps de flush_to_json ; appeler avec _JSON_LOCK verrouillé."""
+    global _LOG_DIRTY
+    _ensure_log_file()
+    # Remis à zéro avant la lecture : une entrée écrite pendant la
+    # régénération la marque de nouveau à refaire
+    _LOG_DIRTY = False
+    experiments = _load_all()
+    known = {_experiment_key(exp) for exp in experiments}
+    missing = sum(1 for exp in _read_legacy_json() if _experiment_key(exp) not in known)
+    if missing:
+        raise ValueError(
+            f"❌ {LOG_FILE} contient {missing} expérience(s) absente(s) de "
+            f"{LOG_FILE_JSONL} : il n'est pas régénéré. Fusionnez les deux "
+            f"fichiers ou supprimez le journal pour repartir de {LOG_FILE}."
+        )
+    data = {"experiments": experiments}
+    tmp = f"{LOG_FILE}.{os.getpid()}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(_json.dumpb(data, indent=True))
+    os.replace(tmp, LOG_FILE)
+    return LOG_FILE
+
+
+def log_experiment_async(
+    agent_name: str,
+    model_used: str,
+    action: ActionType,
+    details: dict[str, Any],
+    status: str = "SUCCESS"
+) -> str:
+    """
+    Variante non bloquante de log_experiment pour les outils appelés en boucle.
+
+    L'entrée est validée et sérialisée immédiatement (mêmes erreurs que
+    log_experiment) et rejoint le même tampon, à sa place parmi les
+    entrées de log_experiment ; un thread d'arrière-plan écrit ensuite
+    tout ce qui est en attente. Les erreurs d'E/S ne remontent pas à
+    l'appelant : elles sont signalées sur stderr. Utiliser flush_logs()
+    pour attendre l'écriture.
+
+    Returns:
+        str: L'ID unique de l'expérience loggée
+    """
+    entry = _build_entry(agent_name, model_used, action, details, status)
+    line = _dump_line(entry)
+    with _BUFFER_LOCK:
+        _BUFFER.append(line)
+    _start_log_worker()
+    _LOG_WAKE.set()
+    return entry["id"]
+
+
+def _start_log_worker():
+    """Démarre le thread d'écriture en arrière-plan au premier besoin."""
+    global _log_worker
+    if _log_worker is None:
+        with _LOG_LOCK:
+            if _log_worker is None:
+                _log_worker = threading.Thread(
+                    target=_log_writer, name="log-writer", daemon=True
+                )
+                _log_worker.start()
+
+
+def _log_writer():
+    """
+    Boucle du thread d'écriture : écrit le tampon à chaque réveil, et
+    régénère LOG_FILE quand le journal a changé depuis _JSON_INTERVAL s.
+    """
+    last_json = time.monotonic()
+    last_error = None
+    while True:
+        _LOG_WAKE.wait(_FLUSH_INTERVAL)
+        _LOG_WAKE.clear()
+        try:
+            _flush()
+        except Exception as e:
+            print(
+                f"⚠️ log-writer : entrées non écrites dans {LOG_FILE_JSONL} : {e!r}",
+                file=sys.stderr
+            )
+        if _LOG_DIRTY and time.monotonic() - last_json >= _JSON_INTERVAL:
+            last_json = time.monotonic()
+            try:
+                flush_to_json()
+                last_error = None
+            except (OSError, ValueError) as e:
+                # Signalé une fois ; main.py échoue sur la même erreur
+                if str(e) != last_error:
+                    last_error = str(e)
+                    print(e, file=sys.stderr)
+
+
+def flush_logs():
+    """
+    Écrit les entrées en attente (log_experiment et log_experiment_async).
+
+    Une écriture en cours dans le thread d'arrière-plan tient _LOG_LOCK :
+    au retour, tout ce qui a été loggé avant l'appel est dans le journal.
+    """
+    _flush()
+
+
+def _flush_at_exit():
+    """Vide la file (le thread est démon) puis régénère LOG_FILE si besoin."""
+    flush_logs()
+    if _LOG_DIRTY:
+        try:
+            flush_to_json()
+        except (OSError, ValueError) as e:
+            print(e, file=sys.stderr)
+
+
+atexit.register(_flush_at_exit)
+
+
+def _count_experiment(exp: dict, counters: tuple) -> None:
+    """Ajoute une expérience aux compteurs (agents, actions, statuts)."""
+    agents, actions, statuses = counters
+    agents[exp.get("agent_name", "unknown")] += 1
+    actions[exp.get("action", "unknown")] += 1
+    statuses[exp.get("status", "FAILURE")] += 1
+
+
+def _journal_counters() -> tuple:
+    """
+    Compteurs du journal JSONL, mis à jour de façon incrémentale : le
+    journal étant en ajout seul, seules les lignes ajoutées depuis
+    l'appel précédent sont lues. Relecture complète si le fichier a été
+    remplacé ou tronqué.
+    """
+    global _STATS_CACHE
+    with _STATS_LOCK:
+        st = os.stat(LOG_FILE_JSONL)
+        cache = _STATS_CACHE
+        if cache is None or cache[0] != st.st_ino or cache[1] > st.st_size:
+            cache = (st.st_ino, 0, (Counter(), Counter(), Counter()))
+        ino, offset, counters = cache
+
+        if offset < st.st_size:
+            with open(LOG_FILE_JSONL, 'rb') as f:
+                f.seek(offset)
+                for line in f:
+                    # Ligne en cours d'écriture : elle sera lue au prochain appel
+                    if not line.endswith(b"\n"):
+                        break
+                    offset += len(line)
+                    if not line.strip():
+                        continue
+                    try:
+                        _count_experiment(_json.loads(line), counters)
+                    except _json.JSONDecodeError:
+                        continue
+            _STATS_CACHE = (ino, offset, counters)
+
+        return tuple(c.copy() for c in counters)
 
 
 def get_experiment_stats() -> dict:
@@ -154,43 +517,21 @@ def get_experiment_stats() -> dict:
     Returns:
         dict: Statistiques (total, par agent, par action, par statut).
     """
-    _ensure_log_file()
-    
-    with open(LOG_FILE, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    experiments = data.get("experiments", [])
-    
-    if not experiments:
-        return {
-            "total_experiments": 0,
-            "by_agent": {},
-            "by_action": {},
-            "by_status": {}
-        }
+    flush_logs()
+    if os.path.exists(LOG_FILE_JSONL):
+        agents, actions, statuses = _journal_counters()
+    else:
+        # Pas encore de journal : un passage sur l'ancien fichier JSON
+        agents, actions, statuses = counters = (Counter(), Counter(), Counter())
+        for exp in iter_experiments():
+            _count_experiment(exp, counters)
     
-    stats = {
-        "total_experiments": len(experiments),
-        "by_agent": {},
-        "by_action": {},
-        "by_status": {"SUCCESS": 0, "FAILURE": 0}
+    return {
+        "total_experiments": sum(agents.values()),
+        "by_agent": dict(agents),
+        "by_action": dict(actions),
+        "by_status": {"SUCCESS": statuses["SUCCESS"], "FAILURE": statuses["FAILURE"]}
     }
-    
-    for exp in experiments:
-        # Compter par agent
-        agent = exp.get("agent_name", "unknown")
-        stats["by_agent"][agent] = stats["by_agent"].get(agent, 0) + 1
-        
-        # Compter par action
-        action = exp.get("action", "unknown")
-        stats["by_action"][action] = stats["by_action"].get(action, 0) + 1
-        
-        # Compter par statut
-        status = exp.get("status", "FAILURE")
-        if status in stats["by_status"]:
-            stats["by_status"][status] += 1
-    
-    return stats
 
 
 def validate_log_entry(entry: dict) -> bool:
@@ -203,61 +544,16 @@ def validate_log_entry(entry: dict) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    required_fields = [
-        "id", "timestamp", "agent_name", 
-        "model_used", "action", "details", "status"
-    ]
-    
-    # Check top-level fields
-    for field in required_fields:
-        if field not in entry:
-            return False
-    
-    # Check details has required fields
-    if "input_prompt" not in entry["details"]:
+    # Check top-level fields, then details, with one set difference each
+    if REQUIRED_FIELDS - entry.keys():
+        return False
+    if not isinstance(entry["details"], dict):
         return False
-    if "output_response" not in entry["details"]:
+    if REQUIRED_DETAILS - entry["details"].keys():
         return False
     
     return True
 
-def get_experiment_stats() -> dict:
-    """
-    Get statistics about logged experiments.
-    
-    Returns:
-        Dictionary with stats (total_experiments, by_agent, by_action, etc.)
-    """
-    _ensure_log_file()
-    
-    with open(LOG_FILE, 'r') as f:
-        data = json.load(f)
-    
-    experiments = data.get("experiments", [])
-    
-    stats = {
-        "total_experiments": len(experiments),
-        "by_agent": {},
-        "by_action": {},
-        "by_status": {"SUCCESS": 0, "FAILURE": 0}
-    }
-    
-    for exp in experiments:
-        # Count by agent
-        agent = exp.get("agent_name", "unknown")
-        stats["by_agent"][agent] = stats["by_agent"].get(agent, 0) + 1
-        
-        # Count by action
-        action = exp.get("action", "unknown")
-        stats["by_action"][action] = stats["by_action"].get(action, 0) + 1
-        
-        # Count by status
-        status = exp.get("status", "FAILURE")
-        if status in stats["by_status"]:
-            stats["by_status"][status] += 1
-    
-    return stats
-
 def log_iteration(
     iteration_number: int,
     phase: str,
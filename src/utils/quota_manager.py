@@ -2,6 +2,8 @@
 Quota Manager - Tracks and limits API usage to prevent quota exhaustion
 """
 
+import asyncio
+import threading
 import time
 from typing import Dict
 from datetime import datetime
@@ -28,9 +30,26 @@ class QuotaManager:
         self._initialized = True
         self.call_count: int = 0
         self.agent_calls: Dict[str, int] = {}
-        self.start_time: float = time.time()
-        self.last_call_time: float = 0
+        self.start_time: float = time.monotonic()
+        self.last_call_time: float = float("-inf")
         self.min_delay: float = 1.0  # Minimum 1 second between calls
+        self._lock = threading.Lock()
+    
+    def _reserve(self, agent_name: str) -> float:
+        """
+        Record a call and reserve its slot; returns how long to wait for it.
+        
+        The lock is only held to book the slot, so callers wait in parallel
+        for consecutive slots instead of queuing behind one sleeping caller.
+        """
+        with self._lock:
+            # Monotonic clock: wall-clock adjustments cannot stretch the wait
+            now = time.monotonic()
+            slot = max(now, self.last_call_time + self.min_delay)
+            self.last_call_time = slot
+            self.call_count += 1
+            self.agent_calls[agent_name] = self.agent_calls.get(agent_name, 0) + 1
+        return slot - now
     
     def check_and_record(self, agent_name: str) -> bool:
         """
@@ -43,37 +62,49 @@ class QuotaManager:
             True if call is allowed
         """
         # Simple rate limiting: enforce minimum delay between calls
-        current_time = time.time()
-        time_since_last = current_time - self.last_call_time
-        
-        if time_since_last < self.min_delay:
-            wait_time = self.min_delay - time_since_last
+        wait_time = self._reserve(agent_name)
+        if wait_time > 0:
             print(f"⏱️  Rate limit: waiting {wait_time:.1f}s...")
             time.sleep(wait_time)
         
-        # Record the call
-        self.call_count += 1
-        self.agent_calls[agent_name] = self.agent_calls.get(agent_name, 0) + 1
-        self.last_call_time = time.time()
+        return True
+    
+    async def acheck_and_record(self, agent_name: str) -> bool:
+        """
+        Async variant of check_and_record; other tasks keep running while
+        this one waits for its slot.
+        
+        Args:
+            agent_name: Name of the agent making the call
+            
+        Returns:
+            True if call is allowed
+        """
+        wait_time = self._reserve(agent_name)
+        if wait_time > 0:
+            print(f"⏱️  Rate limit: waiting {wait_time:.1f}s...")
+            await asyncio.sleep(wait_time)
         
         return True
     
     def get_stats(self) -> Dict:
         """Get usage statistics."""
-        elapsed = time.time() - self.start_time
-        return {
-            "total_calls": self.call_count,
-            "elapsed_seconds": elapsed,
-            "calls_per_minute": (self.call_count / elapsed * 60) if elapsed > 0 else 0,
-            "agent_breakdown": self.agent_calls
-        }
+        with self._lock:
+            elapsed = time.monotonic() - self.start_time
+            return {
+                "total_calls": self.call_count,
+                "elapsed_seconds": elapsed,
+                "calls_per_minute": (self.call_count / elapsed * 60) if elapsed > 0 else 0,
+                "agent_breakdown": dict(self.agent_calls)
+            }
     
     def reset(self):
         """Reset all counters."""
-        self.call_count = 0
-        self.agent_calls = {}
-        self.start_time = time.time()
-        self.last_call_time = 0
+        with self._lock:
+            self.call_count = 0
+            self.agent_calls = {}
+            self.start_time = time.monotonic()
+            self.last_call_time = float("-inf")
 
 
 # Global singleton instance
@@ -0,0 +1,12 @@
+"""
+Configuration commune des tests
+"""
+
+import sys
+from pathlib import Path
+
+# Rend le package src importable quel que soit le dossier de lancement,
+# une seule fois pour toute la session
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
@@ -0,0 +1,64 @@
+"""
+Fixtures partagees des tests du logger
+"""
+
+import builtins
+import os
+
+import pytest
+
+from src.utils import _json, logger
+
+# Dernier parse de LOG_FILE, associe a l'etat du journal dont il provient
+_LOG_CACHE = {}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_log(tmp_path_factory):
+    """
+    Redirige LOG_FILE et LOG_FILE_JSONL vers un dossier temporaire propre a
+    la session : chaque session part d'un journal vide et le livrable
+    logs/experiment_data.json n'est jamais modifie par les tests.
+    """
+    log_dir = tmp_path_factory.mktemp("logs")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(logger, "LOG_FILE", str(log_dir / "experiment_data.json"))
+        mp.setattr(logger, "LOG_FILE_JSONL", str(log_dir / "experiment_data.jsonl"))
+        logger.reset_log_state()
+        yield log_dir
+        # Regenerer ici pour que l'export a la sortie ne cible pas le vrai fichier
+        logger.flush_logs()
+        logger.flush_to_json()
+    logger.reset_log_state()
+
+
+@pytest.fixture
+def log_reader():
+    """
+    Renvoie une fonction qui lit LOG_FILE : (data, index), avec data le
+    contenu {"experiments": [...]} et index l'acces direct {id: experience}.
+
+    Le fichier n'est regenere et reparse que si le journal JSONL a change
+    depuis la lecture precedente.
+    """
+    def read() -> tuple:
+        logger.flush_logs()
+        st = os.stat(logger.LOG_FILE_JSONL)
+        key = (logger.LOG_FILE_JSONL, st.st_ino, st.st_mtime_ns, st.st_size)
+        if _LOG_CACHE.get("key") != key:
+            with open(logger.flush_to_json(), 'rb') as f:
+                data = _json.loads(f.read())
+            index = {exp["id"]: exp for exp in data["experiments"]}
+            _LOG_CACHE["data"] = (data, index)
+            _LOG_CACHE["key"] = key
+        return _LOG_CACHE["data"]
+
+    return read
+
+
+@pytest.fixture
+def no_disk(monkeypatch):
+    """Fait echouer tout acces fichier : le test ne doit pas toucher au disque."""
+    def _open(*args, **kwargs):
+        raise AssertionError(f"acces disque inattendu: {args[0]!r}")
+    monkeypatch.setattr(builtins, "open", _open)